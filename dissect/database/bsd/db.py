@@ -27,13 +27,14 @@ class DB:
         self.fh = fh
         self.fh.seek(0)
 
-        meta = c_db.DBMETA(self.fh)
-        self.fh.seek(0)
+        # Read the metadata page once and parse both the generic and the type specific header from it
+        buf = self.fh.read(max(len(c_db.BTMETA), len(c_db.HMETA)))
+        meta = c_db.DBMETA(buf)
 
         if meta.magic == c_db.DB_BTREEMAGIC and meta.type == c_db.P_BTREEMETA:
-            self.meta = c_db.BTMETA(self.fh)
+            self.meta = c_db.BTMETA(buf)
         elif meta.magic == c_db.DB_HASHMAGIC and meta.type == c_db.P_HASHMETA:
-            self.meta = c_db.HMETA(self.fh)
+            self.meta = c_db.HMETA(buf)
         else:
             raise NotImplementedError(f"Unsupported DB type: {meta.magic:#x} {meta.type}")
 
@@ -102,14 +103,17 @@ class DB:
         yield from self._walk_btree(self.meta.root)
 
     def _walk_btree(self, pgno: int) -> Iterator[DBT]:
-        page = self.page(pgno)
-        if page.header.type in (c_db.P_IBTREE, c_db.P_IRECNO):
-            # Internal page
-            for entry, _ in page.entries():
-                yield from self._walk_btree(entry.pgno)
-        elif page.header.type in (c_db.P_LBTREE, c_db.P_LRECNO):
-            # Leaf page
-            yield from page.entries()
+        # Use an explicit stack of page numbers to visit instead of recursing,
+        # so entries aren't passed through a generator for every level of the tree
+        stack = [pgno]
+        while stack:
+            page = self.page(stack.pop())
+            if page.header.type in (c_db.P_IBTREE, c_db.P_IRECNO):
+                # Internal page, push the children in reverse so they are visited in order
+                stack.extend(reversed([entry.pgno for entry, _ in page.entries()]))
+            elif page.header.type in (c_db.P_LBTREE, c_db.P_LRECNO):
+                # Leaf page
+                yield from page.entries()
 
     def _iter_hash(self) -> Iterator[DBT]:
         for i in range(self.meta.max_bucket + 1):
@@ -117,11 +121,13 @@ class DB:
             yield from self._walk_hash(pgno)
 
     def _walk_hash(self, pgno: int) -> Iterator[DBT]:
-        page = self.page(pgno)
-        yield from page.entries()
+        # Follow the chain of pages of a bucket iteratively, long chains would otherwise nest a generator per page
+        while True:
+            page = self.page(pgno)
+            yield from page.entries()
 
-        if page.header.next_pgno:
-            yield from self._walk_hash(page.header.next_pgno)
+            if not (pgno := page.header.next_pgno):
+                break
 
 
 class Page:
@@ -179,41 +185,43 @@ class Page:
         if index >= len(self.lookup):
             raise IndexError("Index out of range")
 
-        buf = memoryview(self.raw)[self.lookup[index] :]
-        # These are the types that can be DBTs
-        if self.header.type in (c_db.P_HASH_UNSORTED, c_db.P_HASH):
-            if buf[0] == c_db.H_OFFPAGE:
-                entry = c_db.HOFFPAGE(buf)
-                return entry, overflow_data(self.db, entry.pgno, entry.tlen)
+        # Dispatch on the page type with a single lookup, instead of comparing against every page type constant
+        if (parse_entry := _ENTRY_PARSERS.get(self.header.type)) is None:
+            raise NotImplementedError(f"Page type not implemented: {self.header.type}")
+
+        return parse_entry(self, index, memoryview(self.raw)[self.lookup[index] :])
 
-            next_offset = self.db.page_size if index == 0 else self.lookup[index - 1]
-            data_length = (next_offset - self.lookup[index]) - len(c_db.HKEYDATA)
+    def _hash_entry(self, index: int, buf: memoryview) -> DBT:
+        if buf[0] == c_db.H_OFFPAGE:
+            entry = c_db.HOFFPAGE(buf)
+            return entry, overflow_data(self.db, entry.pgno, entry.tlen)
 
-            return c_db.HKEYDATA(buf), buf[len(c_db.HKEYDATA) : len(c_db.HKEYDATA) + data_length]
+        next_offset = self.db.page_size if index == 0 else self.lookup[index - 1]
+        data_length = (next_offset - self.lookup[index]) - len(c_db.HKEYDATA)
 
-        if self.header.type == c_db.P_HEAP:
-            entry = c_db.HEAPHDR(buf)
-            if entry.flags & (c_db.HEAP_RECSPLIT | c_db.HEAP_RECFIRST):
-                raise NotImplementedError("Heap split records not implemented")
-            return entry, buf[len(c_db.HEAPHDR) : len(c_db.HEAPHDR) + entry.size]
+        return c_db.HKEYDATA(buf), buf[len(c_db.HKEYDATA) : len(c_db.HKEYDATA) + data_length]
 
-        if self.header.type in (c_db.P_LBTREE, c_db.P_LDUP, c_db.P_LRECNO):
-            entry = c_db.BKEYDATA(buf)
-            if entry.type == c_db.B_OVERFLOW:
-                entry = c_db.BOVERFLOW(buf)
-                return entry, overflow_data(self.db, entry.pgno, entry.tlen)
+    def _heap_entry(self, index: int, buf: memoryview) -> DBT:
+        entry = c_db.HEAPHDR(buf)
+        if entry.flags & (c_db.HEAP_RECSPLIT | c_db.HEAP_RECFIRST):
+            raise NotImplementedError("Heap split records not implemented")
+        return entry, buf[len(c_db.HEAPHDR) : len(c_db.HEAPHDR) + entry.size]
 
-            return entry, buf[len(c_db.BKEYDATA) : len(c_db.BKEYDATA) + entry.len]
+    def _btree_leaf_entry(self, index: int, buf: memoryview) -> DBT:
+        # Peek at the type byte (shared by BKEYDATA and BOVERFLOW) so we only parse the structure once
+        if buf[2] == c_db.B_OVERFLOW:
+            entry = c_db.BOVERFLOW(buf)
+            return entry, overflow_data(self.db, entry.pgno, entry.tlen)
 
-        # These are more internal types, but we still want to parse them
-        if self.header.type == c_db.P_IBTREE:
-            entry = c_db.BINTERNAL(buf)
-            return entry, buf[len(c_db.BINTERNAL) : len(c_db.BINTERNAL) + entry.len]
+        entry = c_db.BKEYDATA(buf)
+        return entry, buf[len(c_db.BKEYDATA) : len(c_db.BKEYDATA) + entry.len]
 
-        if self.header.type == c_db.P_IRECNO:
-            return c_db.RINTERNAL(buf), b""
+    def _btree_internal_entry(self, index: int, buf: memoryview) -> DBT:
+        entry = c_db.BINTERNAL(buf)
+        return entry, buf[len(c_db.BINTERNAL) : len(c_db.BINTERNAL) + entry.len]
 
-        raise NotImplementedError(f"Page type not implemented: {self.header.type}")
+    def _recno_internal_entry(self, index: int, buf: memoryview) -> DBT:
+        return c_db.RINTERNAL(buf), b""
 
     def entries(self) -> Iterator[DBT]:
         """Iterate over all entries in the page."""
@@ -224,6 +232,19 @@ class Page:
             yield self.entry(idx)
 
 
+# These are the types that can be DBTs, but we also parse the more internal types
+_ENTRY_PARSERS = {
+    c_db.P_HASH_UNSORTED: Page._hash_entry,
+    c_db.P_HASH: Page._hash_entry,
+    c_db.P_HEAP: Page._heap_entry,
+    c_db.P_LBTREE: Page._btree_leaf_entry,
+    c_db.P_LDUP: Page._btree_leaf_entry,
+    c_db.P_LRECNO: Page._btree_leaf_entry,
+    c_db.P_IBTREE: Page._btree_internal_entry,
+    c_db.P_IRECNO: Page._recno_internal_entry,
+}
+
+
 def overflow_data(db: DB, pgno: int, size: int) -> bytes:
     """Get off-page data.
 
@@ -251,13 +272,8 @@ def overflow_data(db: DB, pgno: int, size: int) -> bytes:
 
 
 def _db_log2(num: int) -> int:
-    i = 0
-    limit = 1
-    while limit < num:
-        i += 1
-        limit = limit << 1
-
-    return i
+    # Smallest i such that (1 << i) >= num
+    return (num - 1).bit_length() if num > 1 else 0
 
 
 def BS_TO_PAGE(bucket: int, spares: list[int]) -> int:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import posixpath
 import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple
 
@@ -12,7 +13,7 @@ from dissect.database.bsd import db
 from dissect.database.bsd.tools.c_rpm import c_rpm
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
 
 TYPE_SIZE_MAP = {
@@ -50,6 +51,11 @@ ARRAY_TYPES = (
     c_rpm.rpmTagType.RPM_INT64_TYPE,
 )
 
+# Map the raw type values to their size, parser and whether they can be arrays, so parsing an entry doesn't have to
+# create and compare rpmTagType enums (which is relatively slow)
+_TYPE_INFO = {type_.value: (TYPE_SIZE_MAP[type_], TYPE_PARSERS[type_], type_ in ARRAY_TYPES) for type_ in TYPE_SIZE_MAP}
+_RPM_STRING_ARRAY_TYPE = c_rpm.rpmTagType.RPM_STRING_ARRAY_TYPE.value
+
 
 class PackageEntry(NamedTuple):
     path: str
@@ -140,6 +146,15 @@ class Package:
             )
 
 
+@lru_cache(1024)
+def _array_parser(type_: int, count: int) -> Callable[[bytes], list[int]]:
+    """Return the array parser for the given raw type value and count.
+
+    Creating a new cstruct array type is relatively expensive, and most packages repeat the same few combinations.
+    """
+    return _TYPE_INFO[type_][1][count]
+
+
 def _as_list(value: Any) -> list[Any]:
     return [value] if not isinstance(value, list) else value
 
@@ -169,10 +184,7 @@ class HeaderBlob:
         """Get the ``(tag, value)`` for the given index."""
         entry = self.header.entries[idx]
 
-        tag = c_rpm.rpmTag(entry.tag)
-        type = c_rpm.rpmTagType(entry.type)
-
-        type_size = TYPE_SIZE_MAP[type]
+        type_size, parser, is_array = _TYPE_INFO[entry.type]
         if type_size == -1:
             next_entry = self.header.entries[idx + 1] if idx + 1 < self.header.index_length else None
             data_size = (next_entry.offset if next_entry else len(self.buf)) - entry.offset
@@ -181,12 +193,11 @@ class HeaderBlob:
 
         data = self.buf[self.data_start + entry.offset : self.data_start + entry.offset + data_size]
 
-        parser = TYPE_PARSERS[type]
-        if type in ARRAY_TYPES and entry.count > 1:
-            parser = parser[entry.count]
+        if is_array and entry.count > 1:
+            parser = _array_parser(entry.type, entry.count)
 
-        value = parser(data, entry.count) if type == c_rpm.rpmTagType.RPM_STRING_ARRAY_TYPE else parser(data)
-        return tag, value
+        value = parser(data, entry.count) if entry.type == _RPM_STRING_ARRAY_TYPE else parser(data)
+        return c_rpm.rpmTag(entry.tag), value
 
     def entries(self) -> Iterator[tuple[c_rpm.rpmTag, int | str | bytes | list[int] | list[str] | None]]:
         """Iterate over all ``(tag, value)`` entries in the header."""
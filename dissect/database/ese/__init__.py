@@ -13,7 +13,6 @@ from dissect.database.ese.table import Table
 
 __all__ = [
     "ESE",
-    "CompressedTaggedDataError",
     "Index",
     "InvalidDatabase",
     "KeyNotFoundError",
@@ -7,10 +7,11 @@ from dissect.database.ese.exception import NoNeighbourPageError
 from dissect.database.ese.record import Record
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from dissect.database.ese.index import Index
     from dissect.database.ese.page import Node
+    from dissect.database.ese.table import Column
     from dissect.database.ese.util import RecordValue
 
 
@@ -125,9 +126,15 @@ class Cursor:
 
         Args:
             **kwargs: The columns and values to search for.
+
+        Raises:
+            KeyError: If one of the additional columns does not exist in the table.
         """
         indexed_columns = {c.name: kwargs.pop(c.name) for c in self.index.columns}
-        other_columns = kwargs
+        # Resolve the other columns and decide how to compare them once, instead of for every record
+        matchers = [(self.table.column(name), _make_matcher(value)) for name, value in kwargs.items()]
+        # Compare the columns that are cheapest to retrieve first, so mismatching records are rejected early
+        matchers.sort(key=lambda item: _retrieval_cost(item[0]))
 
         # We need at least an exact match on the indexed columns
         self.search(**indexed_columns)
@@ -151,20 +158,9 @@ class Cursor:
                 break
 
             record = self._record()
-            for k, v in other_columns.items():
-                value = record.get(k)
-                # If the record value is a list, we do a check based on the queried value
-                if isinstance(value, list):
-                    # If the queried value is also a list, we check if they are equal
-                    if isinstance(v, list):
-                        if value != v:
-                            break
-                    # Otherwise we check if the queried value is in the record value
-                    elif v not in value:
-                        break
-                else:
-                    if value != v:
-                        break
+            for column, matcher in matchers:
+                if not matcher(record._data.get(column)):
+                    break
             else:
                 yield record
 
@@ -208,3 +204,39 @@ class Cursor:
         except NoNeighbourPageError:
             raise IndexError("No previous record")
         return self._record()
+
+
+def _make_matcher(value: RecordValue | list[RecordValue]) -> Callable[[RecordValue], bool]:
+    """Return a function that checks if a record value matches the queried ``value``.
+
+    If the queried value is a list, the record value must be equal to it. Otherwise, a record value that is a list
+    matches if it contains the queried value, and any other record value must be equal to it.
+
+    Args:
+        value: The queried value to match record values against.
+    """
+    if isinstance(value, list):
+        return lambda record_value: record_value == value
+
+    def matcher(record_value: RecordValue) -> bool:
+        if isinstance(record_value, list):
+            return value in record_value
+        return record_value == value
+
+    return matcher
+
+
+def _retrieval_cost(column: Column) -> int:
+    """Return the relative cost of retrieving the value of ``column`` from a record.
+
+    Fixed columns are at a precalculated offset, variable columns require an offset lookup and tagged columns
+    require a search through the tagged fields.
+
+    Args:
+        column: The column to return the retrieval cost of.
+    """
+    if column.is_fixed:
+        return 0
+    if column.is_variable:
+        return 1
+    return 2
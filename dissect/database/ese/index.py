@@ -10,6 +10,8 @@ from dissect.database.ese.cursor import Cursor
 from dissect.database.ese.lcmapstring import map_string
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from dissect.database.ese.page import Node, Page
     from dissect.database.ese.record import Record
     from dissect.database.ese.table import Column, Table
@@ -45,10 +47,20 @@ class Index:
     def __repr__(self) -> str:
         return f"<Index name={self.name!r}>"
 
-    @property
+    @cached_property
     def is_primary(self) -> bool:
         return bool(self.idb_flags & IDBFLAG.Primary)
 
+    @cached_property
+    def lcmap_flags(self) -> int:
+        """Return the ``LCMapStringEx`` flags used for normalizing Unicode text in this index."""
+        return self.record.get("LCMapFlags")
+
+    @cached_property
+    def locale_name(self) -> str:
+        """Return the locale name used for normalizing Unicode text in this index."""
+        return self.record.get("LocaleName").decode("utf-16-le")
+
     @cached_property
     def root(self) -> Page:
         """Return the root page of this index."""
@@ -57,13 +69,10 @@ class Index:
     @cached_property
     def column_ids(self) -> list[int]:
         """Return a list of column IDs that are used in this index."""
-        column_ids = []
         key_field_ids = self.record.get("KeyFldIDs")
         if len(key_field_ids) % 4 == 0:
-            for i in range(0, len(key_field_ids), 4):
-                _, column_identifier = struct.unpack("<HH", key_field_ids[i : i + 4])
-                column_ids.append(column_identifier)
-        return column_ids
+            return [column_identifier for _, column_identifier in struct.iter_unpack("<HH", key_field_ids)]
+        return []
 
     @cached_property
     def columns(self) -> list[Column]:
@@ -153,34 +162,9 @@ def encode_key(index: Index, column: Column, value: RecordValue, max_size: int)
     # There are other prefixes but we don't support those yet
     key = bytearray([bPrefixData])
 
-    if column.type == JET_coltyp.Bit:
-        key.append(0xFF if value else 0x00)
-
-    elif column.type == JET_coltyp.UnsignedByte:
-        key.append(value)
-
-    elif column.type == JET_coltyp.Short:
-        # Signed integers have their MSB bit flipped
-        key += struct.pack(">H", (value ^ (1 << 15)) & 0xFFFF)
-
-    elif column.type == JET_coltyp.Long:
-        key += struct.pack(">I", (value ^ (1 << 31)) & 0xFFFFFFFF)
-
-    elif column.type in (JET_coltyp.Currency, JET_coltyp.LongLong):
-        key += struct.pack(">Q", (value ^ (1 << 63)) & 0xFFFFFFFFFFFFFFFF)
-
-    elif column.type == JET_coltyp.IEEESingle:
-        value = struct.unpack("<I", struct.pack("<f", value))[0]
-
-        value = _flip_bits(value, 32)
-        key += struct.pack(">I", value)
-
-    elif column.type in (JET_coltyp.IEEEDouble, JET_coltyp.DateTime):
-        if column.type == JET_coltyp.IEEEDouble:
-            value = struct.unpack("<Q", struct.pack("<d", value))[0]
-
-        value = _flip_bits(value, 64)
-        key += struct.pack(">Q", value)
+    # Most column types encode their value independently of the column, so dispatch on the raw type value
+    if (encoder := _KEY_ENCODERS.get(column.type.value)) is not None:
+        key += encoder(value)
 
     elif column.is_binary:
         key += _encode_binary(column, value, max_size)
@@ -188,16 +172,6 @@ def encode_key(index: Index, column: Column, value: RecordValue, max_size: int)
     elif column.is_text:
         key += _encode_text(index, column, value, max_size)
 
-    elif column.type == JET_coltyp.UnsignedLong:
-        # Unsigned variants are added as is
-        key += struct.pack(">I", value)
-
-    elif column.type == JET_coltyp.GUID:
-        key += _encode_guid(value)
-
-    elif column.type == JET_coltyp.UnsignedShort:
-        key += struct.pack(">H", value)
-
     return bytes(key)
 
 
@@ -240,7 +214,7 @@ def _encode_binary(column: Column, value: bytes, max_size: int) -> bytes:
                     key.append(cbFLDBinaryChunk if normalized_all else cbFLDBinaryChunkNormalized)
                 else:
                     # Pad to 8 bytes
-                    key.extend([0] * (8 - len(chunk)))
+                    key += bytes(8 - len(chunk))
                     key.append(len(chunk))
             else:
                 key.append(cbFLDBinaryChunkNormalized)
@@ -254,7 +228,7 @@ def _encode_binary(column: Column, value: bytes, max_size: int) -> bytes:
                 key += value[value_offset : value_offset + key_remaining]
             else:
                 key += value[value_offset : value_offset + value_remaining]
-                key.extend([0] * (key_remaining - value_remaining))
+                key += bytes(key_remaining - value_remaining)
 
     return bytes(key)
 
@@ -273,9 +247,7 @@ def _encode_text(index: Index, column: Column, value: str, max_size: int) -> byt
         key.append(0)
     else:
         # Unicode strings == LCMapStringW
-        flags = index.record.get("LCMapFlags")
-        locale = index.record.get("LocaleName").decode("utf-16-le")
-        segment = map_string(value, flags, locale)
+        segment = map_string(value, index.lcmap_flags, index.locale_name)
         key += segment[:max_size]
 
     return bytes(key)
@@ -295,3 +267,32 @@ def _flip_bits(value: int, size: int) -> int:
         return ~value & ((1 << size) - 1)
     # Otherwise only the high bit is flipped
     return value ^ (1 << (size - 1))
+
+
+def _encode_float(value: float) -> bytes:
+    value = struct.unpack("<I", struct.pack("<f", value))[0]
+    return struct.pack(">I", _flip_bits(value, 32))
+
+
+def _encode_double(value: float) -> bytes:
+    value = struct.unpack("<Q", struct.pack("<d", value))[0]
+    return struct.pack(">Q", _flip_bits(value, 64))
+
+
+# Key encoders of the column types that don't depend on the column, keyed by the value of the JET_coltyp
+_KEY_ENCODERS: dict[int, Callable[[RecordValue], bytes]] = {
+    JET_coltyp.Bit.value: lambda value: b"\xff" if value else b"\x00",
+    JET_coltyp.UnsignedByte.value: lambda value: bytes([value]),
+    # Signed integers have their MSB bit flipped
+    JET_coltyp.Short.value: lambda value: struct.pack(">H", (value ^ (1 << 15)) & 0xFFFF),
+    JET_coltyp.Long.value: lambda value: struct.pack(">I", (value ^ (1 << 31)) & 0xFFFFFFFF),
+    JET_coltyp.Currency.value: lambda value: struct.pack(">Q", (value ^ (1 << 63)) & 0xFFFFFFFFFFFFFFFF),
+    JET_coltyp.LongLong.value: lambda value: struct.pack(">Q", (value ^ (1 << 63)) & 0xFFFFFFFFFFFFFFFF),
+    JET_coltyp.IEEESingle.value: _encode_float,
+    JET_coltyp.IEEEDouble.value: _encode_double,
+    JET_coltyp.DateTime.value: lambda value: struct.pack(">Q", _flip_bits(value, 64)),
+    # Unsigned variants are added as is
+    JET_coltyp.UnsignedLong.value: lambda value: struct.pack(">I", value),
+    JET_coltyp.GUID.value: _encode_guid,
+    JET_coltyp.UnsignedShort.value: lambda value: struct.pack(">H", value),
+}
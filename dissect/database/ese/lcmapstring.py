@@ -2,11 +2,10 @@
 # https://github.com/wine-mirror/wine/blob/master/dlls/kernelbase/locale.c
 
 from enum import IntEnum, IntFlag
+from functools import lru_cache
 
 from dissect.util.xmemoryview import xmemoryview
 
-from dissect.database.ese.sorting_table import table
-
 
 class MapFlags(IntFlag):
     NORM_IGNORECASE = 0x00000001  # ignore case
@@ -71,6 +70,18 @@ class SCRIPT(IntEnum):
     CJK_LAST = 239
 
 
+SYMBOL_SCRIPTS = frozenset(
+    (
+        SCRIPT.SYMBOL_1,
+        SCRIPT.SYMBOL_2,
+        SCRIPT.SYMBOL_3,
+        SCRIPT.SYMBOL_4,
+        SCRIPT.SYMBOL_5,
+        SCRIPT.SYMBOL_6,
+    )
+)
+
+
 class CASE(IntFlag):
     FULLWIDTH = 0x01  # full width kana (vs. half width)
     FULLSIZE = 0x02  # full size kana (vs. small)
@@ -82,6 +93,7 @@ class CASE(IntFlag):
     COMPR_6 = 0xC0  # compression exists for >= 6 chars
 
 
+@lru_cache(4096)
 def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
     """Very basic Python implementation of LCMapStringEx, only supporting sorting keys.
 
@@ -113,6 +125,15 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
     if flags & MapFlags.NORM_IGNOREKANATYPE:
         case_mask &= ~CASE.KATAKANA
 
+    # Only use plain integers inside the loop, IntFlag operations are relatively slow to do for every character
+    case_mask = int(case_mask)
+    ignore_diacritic = bool(flags & MapFlags.LINGUISTIC_IGNOREDIACRITIC)
+    ignore_symbols = bool(flags & MapFlags.NORM_IGNORESYMBOLS)
+    string_sort = bool(flags & MapFlags.SORT_STRINGSORT)
+
+    # The sorting table is large, so only load it once a string actually needs to be mapped
+    from dissect.database.ese.sorting_table import table  # noqa: PLC0415
+
     view = xmemoryview(value.encode("utf-16-le"), "<H")
     for cp in view:
         weight = table[cp]
@@ -126,7 +147,7 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
             continue
 
         if script_member == SCRIPT.NONSPACE_MARK:
-            if flags & MapFlags.LINGUISTIC_IGNOREDIACRITIC:
+            if ignore_diacritic:
                 diacritic_weight = 2
 
             if key_diacritic:
@@ -153,10 +174,10 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
             continue
 
         if script_member == SCRIPT.PUNCTUATION:
-            if flags & MapFlags.NORM_IGNORESYMBOLS:
+            if ignore_symbols:
                 continue
 
-            if not flags & MapFlags.SORT_STRINGSORT:
+            if not string_sort:
                 raise NotImplementedError(SCRIPT.PUNCTUATION)
 
             key_primary.append(script_member)
@@ -165,15 +186,8 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
             key_case.append(case_weight)
             continue
 
-        if script_member in (
-            SCRIPT.SYMBOL_1,
-            SCRIPT.SYMBOL_2,
-            SCRIPT.SYMBOL_3,
-            SCRIPT.SYMBOL_4,
-            SCRIPT.SYMBOL_5,
-            SCRIPT.SYMBOL_6,
-        ):
-            if flags & MapFlags.NORM_IGNORESYMBOLS:
+        if script_member in SYMBOL_SCRIPTS:
+            if ignore_symbols:
                 continue
             key_primary.append(script_member)
             key_primary.append(alphabetic_weight)
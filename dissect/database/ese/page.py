@@ -12,6 +12,9 @@ if TYPE_CHECKING:
     from dissect.database.ese.ese import ESE
 
 
+_TAG = struct.Struct("<HH")
+
+
 class Page:
     """Represents a logical page of an ESE database.
 
@@ -28,10 +31,8 @@ class Page:
 
         data_start = len(c_ese.PGHDR)
         self.header = c_ese.PGHDR(self.buf)
-        self.header2 = None
         if not self.is_small_page:
-            # Large pages have some additional header fields
-            self.header2 = c_ese.PGHDR2(self.buf[data_start:])
+            # Large pages have some additional header fields, only parsed when accessed (see header2)
             data_start += len(c_ese.PGHDR2)
 
         self.flags = self.header.fFlags
@@ -49,6 +50,13 @@ class Page:
         self._node_cls = LeafNode if self.is_leaf else BranchNode
         self._node_cache = {}
 
+    @cached_property
+    def header2(self) -> c_ese.PGHDR2 | None:
+        """The additional header fields of large pages, or ``None`` for small pages."""
+        if self.is_small_page:
+            return None
+        return c_ese.PGHDR2(self.buf[len(c_ese.PGHDR) :])
+
     @cached_property
     def is_small_page(self) -> bool:
         return self.db.has_small_pages
@@ -81,6 +89,10 @@ class Page:
     def is_long_value(self) -> bool:
         return bool(self.flags & PAGE_FLAG.LongValue)
 
+    @cached_property
+    def is_new_record_format(self) -> bool:
+        return bool(self.flags & PAGE_FLAG.NewRecordFormat)
+
     @cached_property
     def is_branch(self) -> bool:
         return not self.is_leaf
@@ -125,10 +137,10 @@ class Page:
         if num < 0 or num > self.node_count - 1:
             raise IndexError(f"Node number exceeds boundaries: 0-{self.node_count - 1}")
 
-        if num not in self._node_cache:
-            self._node_cache[num] = self._node_cls(self.tag(num + 1))
+        if (node := self._node_cache.get(num)) is None:
+            node = self._node_cache[num] = self._node_cls(self.tag(num + 1))
 
-        return self._node_cache[num]
+        return node
 
     def nodes(self) -> Iterator[BranchNode | LeafNode]:
         """Yield all nodes."""
@@ -148,18 +160,26 @@ class Page:
         and also parse that. This methods seems to work so far.
         """
         db = self.db
-        leaf = None
-
-        for node in self.nodes():
-            if self.is_leaf:
-                yield node
+        page = self
+        last_leaf_page = None
+
+        # Traverse the branches with an explicit stack of child page numbers, instead of a recursive generator per
+        # level of the tree that every leaf node has to pass through
+        stack = []
+        while True:
+            if page.is_leaf:
+                yield from page.nodes()
+                if page is not self and page.node_count > 0:
+                    last_leaf_page = page
             else:
-                child = db.page(node.child)
-                for leaf in child.iter_leaf_nodes():
-                    yield leaf
+                stack.extend(reversed([node.child for node in page.nodes()]))
+
+            if not stack:
+                break
+            page = db.page(stack.pop())
 
-        if self.is_root and leaf and leaf.tag.page.next_page:
-            yield from db.page(leaf.tag.page.next_page).iter_leaf_nodes()
+        if self.is_root and last_leaf_page and last_leaf_page.next_page:
+            yield from db.page(last_leaf_page.next_page).iter_leaf_nodes()
 
     def __repr__(self) -> str:
         return f"<Page num={self.num:d}>"
@@ -173,20 +193,19 @@ class Tag:
         num: The tag number to parse.
     """
 
-    __slots__ = ("data", "flags", "num", "offset", "page", "size", "tag")
+    __slots__ = ("_flags", "data", "num", "offset", "page", "size")
 
     def __init__(self, page: Page, num: int):
         self.page = page
         self.num = num
 
-        tag_offset = len(page.buf) + ((num + 1) * -4)
-        tag_buf = page.buf[tag_offset : tag_offset + 4]
-
-        self.tag = c_ese.TAG(tag_buf)
+        # Tags are stored in reverse order at the end of the page
+        # Unpack it with a precompiled struct, which is a lot faster than parsing it as a cstruct TAG
+        cb, ib = _TAG.unpack_from(page.buf, len(page.buf) + ((num + 1) * -4))
 
         mask = 0x1FFF if page.is_small_page else 0x7FFF
-        self.size = self.tag.cb_ & mask
-        self.offset = self.tag.ib_ & mask
+        self.size = cb & mask
+        self.offset = ib & mask
 
         if self.size == 0 and self.num != 0:
             raise ValueError("Invalid TAG data, corrupt database?")
@@ -196,18 +215,28 @@ class Tag:
         flags = 0
         if page.is_small_page:
             # Small pages have the flag in the tag
-            flags = self.tag.ib_ >> 13
+            flags = ib >> 13
         elif len(self.data) >= 2:
             # Large pages have the flag in the first USHORT
             # Also in the 3 MSB, just like the small page, but we know it'll be little endian so do a shortcut on
             # the second byte.
             flags = self.data[1] >> 5
 
-        self.flags = TAG_FLAG(flags)
+        # Keep the raw value around so hot paths can bit-test it without constructing a flag
+        self._flags = flags
 
     def __repr__(self) -> str:
         return f"<Tag offset={self.offset:#x} size={self.size:#x}>"
 
+    @property
+    def tag(self) -> c_ese.TAG:
+        tag_offset = len(self.page.buf) + ((self.num + 1) * -4)
+        return c_ese.TAG(self.page.buf[tag_offset : tag_offset + 4])
+
+    @property
+    def flags(self) -> TAG_FLAG:
+        return TAG_FLAG(self._flags)
+
 
 class Node:
     """A node is the "logical" data entry of a page.
@@ -230,7 +259,7 @@ class Node:
 
         # Large pages have the tag flags encoded in the 3 MSB of the first word, so we have to mask the first 13 bits
         # See also the Tag class
-        if len(buf) >= offset + 2 and tag.flags & TAG_FLAG.Compressed:
+        if len(buf) >= offset + 2 and tag._flags & TAG_FLAG.Compressed.value:
             key_prefix_size = struct.unpack("<H", buf[:2])[0] & 0x1FFF
             key_prefix = self.tag.page.key_prefix[:key_prefix_size].ljust(key_prefix_size, b"\x00")
             offset += 2
@@ -253,6 +282,8 @@ class Node:
 class LeafNode(Node):
     """Special leaf node."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"<LeafNode key={self.key}>"
 
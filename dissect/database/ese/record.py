@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import functools
+import itertools
 import struct
 from binascii import hexlify
 from functools import lru_cache
@@ -9,15 +9,28 @@ from typing import TYPE_CHECKING, Any
 from dissect.util.xmemoryview import xmemoryview
 
 from dissect.database.ese import compression
-from dissect.database.ese.c_ese import PAGE_FLAG, TAGFLD_HEADER, c_ese
+from dissect.database.ese.c_ese import TAGFLD_HEADER, c_ese
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-
     from dissect.database.ese.page import Node
     from dissect.database.ese.table import Column, Table
     from dissect.database.ese.util import RecordValue
 
+# Plain integer values of the TAGFLD_HEADER flags, testing these is a lot faster than testing the flag members
+_TAGFLD_COMPRESSED = TAGFLD_HEADER.Compressed.value
+_TAGFLD_SEPARATED = TAGFLD_HEADER.Separated.value
+_TAGFLD_MULTI_VALUES = TAGFLD_HEADER.MultiValues.value
+_TAGFLD_TWO_VALUES = TAGFLD_HEADER.TwoValues.value
+_TAGFLD_NULL = TAGFLD_HEADER.Null.value
+
+_RECHDR = struct.Struct("<BBH")
+
+
+@lru_cache(256)
+def _ushort_array(count: int) -> struct.Struct:
+    """Return a cached ``struct.Struct`` for an array of ``count`` little endian USHORT values."""
+    return struct.Struct(f"<{count}H")
+
 
 def noop(value: Any) -> Any:
     return value
@@ -35,6 +48,8 @@ class Record:
         node: The node of this record.
     """
 
+    __slots__ = ("_data", "_db", "_node", "_table")
+
     def __init__(self, table: Table, node: Node):
         self._table = table
         self._db = table.db
@@ -56,10 +71,10 @@ class Record:
         return self.get(attr)
 
     def __getattr__(self, attr: str) -> RecordValue:
-        try:
-            return self.get(attr)
-        except KeyError:
-            return object.__getattribute__(self, attr)
+        # Resolve the column directly, this is the hot path for attribute style access
+        if (column := self._table._column_name_map.get(attr)) is not None:
+            return self._data.get(column)
+        return object.__getattribute__(self, attr)
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, Record):
@@ -126,13 +141,30 @@ class RecordData:
         NotImplementedError: If old format tagged fields are encountered.
     """
 
+    __slots__ = (
+        "_fixed_null_bitmap",
+        "_last_fixed_id",
+        "_last_variable_id",
+        "_tagged_data_count",
+        "_tagged_data_start",
+        "_tagged_data_view",
+        "_tagged_fields",
+        "_values",
+        "_variable_data_start",
+        "_variable_offset_start",
+        "_variable_offsets",
+        "data",
+        "db",
+        "node",
+        "table",
+    )
+
     def __init__(self, table: Table, node: Node):
         self.table = table
         self.db = table.db
         self.node = node
         self.data = node.data
 
-        self.header = None
         self._values = {}
 
         self._last_fixed_id = None
@@ -150,10 +182,8 @@ class RecordData:
         self._tagged_fields = {}
 
         if len(self.data) >= 4:
-            self.header = c_ese.RECHDR(self.data)
-            self._last_fixed_id = self.header.fidFixedLastInRec
-            self._last_variable_id = self.header.fidVarLastInRec
-            self._variable_offset_start = self.header.ibEndOfFixedData
+            # Unpack the RECHDR with a precompiled struct, which is a lot faster than parsing it with cstruct
+            self._last_fixed_id, self._last_variable_id, self._variable_offset_start = _RECHDR.unpack_from(self.data)
 
             # There's a bitmap between the end of the fixed data and the start of variable data that indicates
             # if a fixed column is null.
@@ -170,8 +200,8 @@ class RecordData:
             if num_variable > 0 and len(self.data) >= 4 + (num_variable * 2):
                 # Parse the variable offsets already, if we have them
                 # There can only be 128 at most, so this shouldn't be an expensive operation
-                self._variable_offsets = struct.unpack(
-                    f"<{num_variable}H", self.data[self._variable_offset_start : self._variable_data_start]
+                self._variable_offsets = _ushort_array(num_variable).unpack(
+                    self.data[self._variable_offset_start : self._variable_data_start]
                 )
 
             self._tagged_data_start = self._variable_data_start
@@ -179,7 +209,7 @@ class RecordData:
                 self._tagged_data_start += self._variable_offsets[-1] & 0x7FFF
 
             if len(self.data) >= self._tagged_data_start + 4:
-                if node.tag.page.flags & PAGE_FLAG.NewRecordFormat == 0:
+                if not node.tag.page.is_new_record_format:
                     raise NotImplementedError("Record has tagged fields in an old format, which is not implemented yet")
 
                 tag_value = int.from_bytes(self.data[self._tagged_data_start : self._tagged_data_start + 4], "little")
@@ -191,10 +221,14 @@ class RecordData:
 
                 self._tagged_data_count = first_tagged_field.offset // 4  # sizeof(TAGFLD)
                 self._tagged_data_view = xmemoryview(tagged_field_data, "<I")
-                self._tagged_fields[first_tagged_field.identifier] = first_tagged_field
+                self._tagged_fields[0] = first_tagged_field
 
-        self._get_tag_field = lru_cache(4096)(self._get_tag_field)
-        self._find_tag_field_idx = lru_cache(4096)(self._find_tag_field_idx)
+    @property
+    def header(self) -> c_ese.RECHDR | None:
+        """The record header, or ``None`` if the record is too small to have one."""
+        if self._last_fixed_id is None:
+            return None
+        return c_ese.RECHDR(self.data)
 
     def get(self, column: Column, raw: bool = False, errors: str | None = "backslashreplace") -> RecordValue:
         """Retrieve the value for the specified column.
@@ -212,9 +246,15 @@ class RecordData:
         value = None
         tag_field = None
 
-        if self.header is None:
+        if self._last_fixed_id is None:
             return value
 
+        if not raw:
+            # Most parsed values are cached, so repeated access to the same column doesn't decode it again
+            key = (column.identifier, errors)
+            if key in self._values:
+                return self._values[key]
+
         if column.is_fixed:
             value = self._get_fixed(column)
 
@@ -230,27 +270,30 @@ class RecordData:
             return value
 
         if value is not None:
-            return self._parse_value(column, value, tag_field, errors)
+            value = self._parse_value(column, value, tag_field, errors)
 
-        return None
+        # Multi-values are returned as a list that the caller may modify, and long values can be arbitrarily large,
+        # so only cache the other values
+        if tag_field is None or not tag_field._flags & (_TAGFLD_MULTI_VALUES | _TAGFLD_SEPARATED):
+            self._values[key] = value
+        return value
 
     def as_dict(self, raw: bool = False, errors: str | None = "backslashreplace") -> dict[str, RecordValue]:
         """Serialize the record as a dictionary."""
         obj = {}
+        column_id_map = self.table._column_id_map
 
-        def _iter_column_id() -> Iterator[Column]:
+        column_ids = itertools.chain(
             # Fixed
-            yield from range(1, self._last_fixed_id + 1)
-
+            range(1, self._last_fixed_id + 1),
             # Variable
-            yield from range(128, self._last_variable_id + 1)
-
-            # Tagged
-            for idx in range(self._tagged_data_count):
-                yield self._get_tag_field(idx).identifier
+            range(128, self._last_variable_id + 1),
+            # Tagged, the identifier is in the lower 16 bits of each TAGFLD
+            (self._tagged_data_view[idx] & 0xFFFF for idx in range(self._tagged_data_count)),
+        )
 
-        for column_id in _iter_column_id():
-            column = self.table._column_id_map[column_id]
+        for column_id in column_ids:
+            column = column_id_map[column_id]
 
             try:
                 obj[column.name] = self.get(column, raw, errors)
@@ -266,15 +309,12 @@ class RecordData:
 
         For tagged columns, also interpret things like multi-values, separated and compressed data.
         """
-        ctype = column.ctype
-        parse_func = ctype.parse
-        if column.is_text:
-            parse_func = functools.partial(ctype.parse, encoding=column.encoding, errors=errors)
+        parse_func = column._parse_func(errors)
 
         if self.db.impacket_compat:
-            if tag_field and tag_field.flags & TAGFLD_HEADER.Compressed:
+            if tag_field and tag_field._flags & _TAGFLD_COMPRESSED:
                 value = None
-            elif tag_field and tag_field.flags & TAGFLD_HEADER.MultiValues:
+            elif tag_field and tag_field._flags & _TAGFLD_MULTI_VALUES:
                 value = hexlify(value)
             elif parse_func is not bytes:
                 value = parse_func(value)
@@ -282,17 +322,17 @@ class RecordData:
                 value = hexlify(value)
         else:
             if tag_field:
-                if tag_field.flags & TAGFLD_HEADER.MultiValues:
+                if tag_field._flags & _TAGFLD_MULTI_VALUES:
                     value = self._parse_multivalue(value, tag_field)
                 else:
-                    if tag_field.flags & TAGFLD_HEADER.Separated:
+                    if tag_field._flags & _TAGFLD_SEPARATED:
                         value = self.table.get_long_value(bytes(value))
-                    elif tag_field.flags & TAGFLD_HEADER.Compressed:
+                    elif tag_field._flags & _TAGFLD_COMPRESSED:
                         # Long values are already decompressed during retrieval
                         value = compression.decompress(value)
 
             parse_func = parse_func or noop
-            if tag_field and tag_field.flags & TAGFLD_HEADER.MultiValues:
+            if tag_field and tag_field._flags & _TAGFLD_MULTI_VALUES:
                 value = list(map(parse_func, value))
             else:
                 value = parse_func(value)
@@ -302,19 +342,19 @@ class RecordData:
     def _parse_multivalue(self, value: bytes, tag_field: TagField) -> list[bytes]:
         fSeparatedInstance = 0x8000
 
-        if tag_field.flags & TAGFLD_HEADER.TwoValues:
+        if tag_field._flags & _TAGFLD_TWO_VALUES:
             # Optimized storage for when a multi-value only has two values
             # First byte is the size of the first value, calculate the size of the second value from that
             first_size = value[0]
             second_size = len(value) - (1 + first_size)
             value = [value[1 : 1 + first_size], value[1 + first_size : 1 + first_size + second_size]]
-        elif tag_field.flags & TAGFLD_HEADER.MultiValues:
+        elif tag_field._flags & _TAGFLD_MULTI_VALUES:
             # Regular multi-value storage, starts with an array of USHORT offsets to the actual values
             # Just calculate the amount of values from the first entry
             # Individual offsets can have a fSeparatedInstance (0x8000) flag set
             first_value_offset = struct.unpack("<H", value[0:2])[0] & 0x7FFF
             num_values = first_value_offset // 2  # sizeof(USHORT)
-            value_offsets = (*struct.unpack(f"<{num_values}H", value[:first_value_offset]), len(value))
+            value_offsets = (*_ushort_array(num_values).unpack(value[:first_value_offset]), len(value))
 
             values = []
             for i in range(num_values):
@@ -327,7 +367,7 @@ class RecordData:
         else:
             raise ValueError(f"Unknown flags for tag field: {tag_field}")
 
-        if tag_field.flags & TAGFLD_HEADER.Compressed:
+        if tag_field._flags & _TAGFLD_COMPRESSED:
             # Only the first entry appears to be compressed
             value[0] = compression.decompress(value[0])
 
@@ -381,6 +421,7 @@ class RecordData:
     def _get_tagged(self, column: Column) -> bytes | None:
         """Parse a specific tagged column."""
         tag_field = None
+        value = None
 
         idx = self._find_tag_field_idx(column.identifier)
         if idx is not None:
@@ -404,7 +445,9 @@ class RecordData:
 
     def _get_tag_field(self, idx: int) -> TagField:
         """Retrieve the :class:`TagField` at the given index in the ``TAGFLD`` array."""
-        return TagField(self, self._tagged_data_view[idx])
+        if (tag_field := self._tagged_fields.get(idx)) is None:
+            tag_field = self._tagged_fields[idx] = TagField(self, self._tagged_data_view[idx])
+        return tag_field
 
     def _find_tag_field_idx(self, identifier: int, is_derived: bool = False) -> TagField | None:
         """Find a tag field by identifier and optional derived flag.
@@ -457,7 +500,7 @@ class RecordData:
 class TagField:
     """Represents a ``TAGFLD``, which contains information about a tagged field in a record."""
 
-    __slots__ = ("_offset", "flags", "has_extended_info", "identifier", "offset", "record")
+    __slots__ = ("_flags", "_offset", "has_extended_info", "identifier", "offset", "record")
 
     fNullSmallPage = 0x2000
     fDerived = 0x8000
@@ -475,19 +518,23 @@ class TagField:
             self.has_extended_info = True
 
         if self.has_extended_info and len(self.record.data) >= self.record._tagged_data_start + self.offset:
-            self.flags = TAGFLD_HEADER(self.record.data[self.record._tagged_data_start + self.offset])
+            self._flags = self.record.data[self.record._tagged_data_start + self.offset]
         else:
-            self.flags = TAGFLD_HEADER.Invalid  # Made up flag member to keep the types consistent
+            self._flags = 0  # TAGFLD_HEADER.Invalid, a made up flag member for fields without flags
 
     def __repr__(self) -> str:
         return f"<TagField identifier={self.identifier} offset={self.offset:#x} flags={str(self.flags).split('.')[1]}>"
 
+    @property
+    def flags(self) -> TAGFLD_HEADER:
+        return TAGFLD_HEADER(self._flags)
+
     @property
     def is_null(self) -> bool:
         """Return whether this tagged field is null."""
         if self.record.db.has_small_pages:
             return bool(self._offset & TagField.fNullSmallPage)
-        return bool(self.flags & TAGFLD_HEADER.Null)
+        return bool(self._flags & _TAGFLD_NULL)
 
     @property
     def is_derived(self) -> bool:
@@ -496,11 +543,16 @@ class TagField:
 
 
 def serialise_record_column_values(record: Record, column_names: list[str] | None = None, max_columns: int = 10) -> str:
-    column_names = column_names or record._table.column_names
+    column_name_map = record._table._column_name_map
+    # Use the columns directly instead of resolving each of their names again
+    columns = column_name_map.items()
+    if column_names:
+        columns = [(name, column_name_map.get(name)) for name in column_names]
+
     columns_with_values = []
-    for name in column_names:
+    for name, column in columns:
         try:
-            value = record.get(name)
+            value = record._data.get(column) if column is not None else "!ERROR!"
         except Exception:
             value = "!ERROR!"
 
@@ -511,5 +563,5 @@ def serialise_record_column_values(record: Record, column_names: list[str] | Non
             break
 
     reprs = " ".join([f"{name}={value!r}" for (name, value) in columns_with_values])
-    has_more = " ..." if max_columns and len(column_names) > max_columns else ""
+    has_more = " ..." if max_columns and len(columns) > max_columns else ""
     return f"{reprs}{has_more}"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import struct
-from functools import cached_property
+import sys
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Any
 
 from dissect.database.ese import compression
@@ -17,7 +18,7 @@ from dissect.database.ese.record import Record
 from dissect.database.ese.util import COLUMN_TYPE_MAP, ColumnType, RecordValue
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from dissect.database.ese.cursor import Cursor
     from dissect.database.ese.ese import ESE
@@ -53,6 +54,8 @@ class Table:
         self._column_name_map: dict[str, Column] = {}
         self._column_id_map: dict[int, Column] = {}
         self._index_name_map: dict[str, Index] = {}
+        self._primary_index: Index | None = None
+        self._find_index_cache: dict[frozenset[str], Index | None] = {}
 
         self.name = name
         self.root_page = root_page
@@ -116,11 +119,7 @@ class Table:
 
     @property
     def primary_index(self) -> Index | None:
-        # It's generally the first index, but loop just in case
-        for index in self.indexes:
-            if index.is_primary:
-                return index
-        return None
+        return self._primary_index
 
     def cursor(self) -> Cursor | None:
         """Create a new cursor for this table."""
@@ -149,13 +148,18 @@ class Table:
         Args:
             column_names: A list of column names to find the best index for.
         """
+        # Only the set of column names matters, so that's what we cache the result on
+        names = frozenset(column_names)
+        if names in self._find_index_cache:
+            return self._find_index_cache[names]
+
         best_match = 0
         best_index = None
         for index in self.indexes:
             # We want to find the index that has the most matching columns in the order they are indexed
             i = 0
             for column in index.columns:
-                if column.name not in column_names:
+                if column.name not in names:
                     break
                 i += 1
 
@@ -163,6 +167,7 @@ class Table:
                 best_index = index
                 best_match = i
 
+        self._find_index_cache[names] = best_index
         return best_index
 
     def search(self, **kwargs: RecordValue) -> Record | None:
@@ -236,16 +241,25 @@ class Table:
         """Add an index to the table."""
         self.indexes.append(index)
         self._index_name_map[index.name] = index
+        self._find_index_cache.clear()
+
+        # It's generally the first index, but check all of them just in case
+        if self._primary_index is None and index.is_primary:
+            self._primary_index = index
 
 
 class Column:
     def __init__(self, identifier: int, name: str, type_: JET_coltyp, record: Record | None = None):
         self.identifier = identifier
-        self.name = name
+        # Column names are the lookup keys for record access, usually with (interned) string literals
+        # Interning them too lets those dictionary lookups succeed on identity
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.type = type_
 
         # Set by the table when added, only relevant for fixed value columns
         self._offset = None
+        # Parse functions per error handling scheme, see _parse_func
+        self._parse_funcs: dict[str | None, Callable[[bytes], Any] | None] = {}
 
         self.record = record
 
@@ -298,6 +312,24 @@ class Column:
     def ctype(self) -> ColumnType:
         return COLUMN_TYPE_MAP[self.type.value]
 
+    def _parse_func(self, errors: str | None = "backslashreplace") -> Callable[[bytes], Any] | None:
+        """Return the function to parse raw values of this column with.
+
+        The function is built once per error handling scheme, so parsing a value doesn't need to inspect the column
+        type or bind the text encoding every time.
+
+        Args:
+            errors: Error handling scheme to use when decoding bytes to text.
+        """
+        try:
+            return self._parse_funcs[errors]
+        except KeyError:
+            parse_func = self.ctype.parse
+            if self.is_text:
+                parse_func = partial(parse_func, encoding=self.encoding, errors=errors)
+            self._parse_funcs[errors] = parse_func
+            return parse_func
+
 
 class Catalog:
     """Parse and interact with the catalog table.
@@ -349,26 +381,34 @@ class Catalog:
         # Create a dummy table with a preset list of columns
         self._ctable = Table(db, None, root_page, columns=self.CATALOG_COLUMNS)
 
+        # Comparing against the enum members is relatively expensive, so do it with their plain values
+        sysobj_table = SYSOBJ.Table.value
+        sysobj_column = SYSOBJ.Column.value
+        sysobj_index = SYSOBJ.Index.value
+        sysobj_long_value = SYSOBJ.LongValue.value
+        sysobj_callback = SYSOBJ.Callback.value
+
         cur_table = None
         for rec in self._ctable.records():
             rtype = rec.get("Type")
-            if rtype == SYSOBJ.Table:
-                cur_table = Table(self.db, rec.get("Name"), rec.get("ColtypOrPgnoFDP"), record=rec)
+            if rtype == sysobj_table:
+                name = rec.get("Name")
+                cur_table = Table(self.db, name, rec.get("ColtypOrPgnoFDP"), record=rec)
                 self.tables.append(cur_table)
-                self._table_name_map[rec.get("Name")] = cur_table
+                self._table_name_map[name] = cur_table
 
-            elif rtype == SYSOBJ.Column:
+            elif rtype == sysobj_column:
                 column = Column(rec.get("Id"), rec.get("Name"), JET_coltyp(rec.get("ColtypOrPgnoFDP")), record=rec)
                 cur_table._add_column(column)
 
-            elif rtype == SYSOBJ.Index:
+            elif rtype == sysobj_index:
                 index = Index(cur_table, record=rec)
                 cur_table._add_index(index)
 
-            elif rtype == SYSOBJ.LongValue:
+            elif rtype == sysobj_long_value:
                 cur_table._long_value_record = rec
 
-            elif rtype == SYSOBJ.Callback:
+            elif rtype == sysobj_callback:
                 cur_table._long_callback_record = rec
 
     def table(self, name: str) -> Table:
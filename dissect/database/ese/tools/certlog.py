@@ -93,6 +93,13 @@ REQUEST_STATUS_CODE = {
     0x80094821: "CERTSRV_E_SEC_EXT_DIRECTORY_SID_REQUIRED",
 }
 
+# Columns of the Requests table of which the value is translated using one of the tables above
+REQUEST_COLUMN_CODES = {
+    "StatusCode": REQUEST_STATUS_CODE,
+    "Disposition": REQUEST_DISPOSITION,
+    "RequestType": REQUEST_TYPE,
+}
+
 
 class CertLog:
     def __init__(self, fh: BinaryIO):
@@ -107,24 +114,32 @@ class CertLog:
         except KeyError:
             return None
 
+        # Determine how to convert the value of every column once, instead of for every record
+        is_requests = table.name == "Requests"
+        columns = [
+            (
+                column.name,
+                column.type == JET_coltyp.DateTime,
+                REQUEST_COLUMN_CODES.get(column.name) if is_requests else None,
+            )
+            for column in table.columns
+        ]
+
         for record in table.records():
             record_data = {"TableName": table.name}
 
-            for column in table.columns:
-                value = record.get(column.name)
+            for name, is_datetime, codes in columns:
+                value = record.get(name)
 
-                if column.type == JET_coltyp.DateTime and value:
+                if is_datetime and value:
                     value = wintimestamp(value)
 
-                if table.name == "Requests":
-                    if column.name == "StatusCode":
-                        value = REQUEST_STATUS_CODE.get(value & 0xFFFFFFFF, value & 0xFFFFFFFF)
-                    if column.name == "Disposition":
-                        value = REQUEST_DISPOSITION.get(value, value)
-                    if column.name == "RequestType":
-                        value = REQUEST_TYPE.get(value, value)
+                if codes is not None:
+                    if name == "StatusCode":
+                        value &= 0xFFFFFFFF
+                    value = codes.get(value, value)
 
-                record_data[column.name] = value
+                record_data[name] = value
 
             yield record_data
 
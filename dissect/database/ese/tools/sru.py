@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO
 
@@ -61,6 +62,9 @@ class SRU:
         id_map_table = self.db.table("SruDbIdMapTable")
         self.id_map = {r.get("IdIndex"): r for r in id_map_table.records()}
 
+        # The same application and user identifiers are referenced by most entries
+        self.resolve_id = lru_cache(4096)(self.resolve_id)
+
     def get_table(self, table_name: str | None = None, table_guid: str | None = None) -> Table | None:
         if all((table_name, table_guid)) or not any((table_name, table_guid)):
             raise ValueError("Either table_name or table_guid must be provided")
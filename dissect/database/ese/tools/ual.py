@@ -42,31 +42,40 @@ class UAL:
         except KeyError:
             return None
 
+        # Determine how to convert the value of every column once, instead of for every record
+        columns = [
+            (
+                column.name,
+                column.name in self.WIN_DATETIME_FIELDS,
+                int(column.name[3:]) if column.name.startswith("Day") else None,
+            )
+            for column in table.columns
+        ]
+
         for record in table.records():
             record_data = {}
 
             last_access_year = None
             day_counts = {}
 
-            for column in table.columns:
-                value = record.get(column.name)
+            for name, is_datetime, day_num in columns:
+                value = record.get(name)
 
-                if column.name in self.WIN_DATETIME_FIELDS:
+                if is_datetime:
                     value = wintimestamp(value)
 
-                if column.name == "LastAccess":
+                if name == "LastAccess":
                     last_access_year = value.year
 
-                if column.name == "Address" and isinstance(value, bytes):
+                if name == "Address" and isinstance(value, bytes):
                     value = ipaddress.ip_address(value)
                     value = str(value)
 
-                if column.name.startswith("Day"):
-                    day_num = int(column.name[3:])
+                if day_num is not None:
                     day_counts[day_num] = value
                     continue
 
-                record_data[column.name] = value
+                record_data[name] = value
 
             if day_counts:
                 if last_access_year:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import codecs
 import datetime
 import struct
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
-from uuid import UUID
 
-from dissect.database.ese.c_ese import CODEPAGE, JET_coltyp, c_ese
+from dissect.database.ese.c_ese import CODEPAGE, JET_coltyp
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -15,6 +16,8 @@ CODEPAGE_MAP = {
     CODEPAGE.WESTERN: "cp1252",
     CODEPAGE.ASCII: "ascii",
 }
+# Decode functions of the codecs in CODEPAGE_MAP, these can decode directly from a memoryview
+_CODEC_DECODERS = {codec: codecs.lookup(codec).decode for codec in CODEPAGE_MAP.values()}
 
 
 RecordValue: TypeAlias = int | float | str | bytes | datetime.datetime | None
@@ -25,8 +28,13 @@ def decode_bit(buf: bytes) -> bool:
 
     Args:
         buf: The buffer to decode from.
+
+    Raises:
+        EOFError: If the buffer is empty.
     """
-    return c_ese.uint8(buf) == 0xFF
+    if not buf:
+        raise EOFError("Read 0 bytes, but expected 1")
+    return buf[0] == 0xFF
 
 
 def decode_text(buf: bytes, encoding: CODEPAGE, errors: str | None = "backslashreplace") -> str:
@@ -35,12 +43,13 @@ def decode_text(buf: bytes, encoding: CODEPAGE, errors: str | None = "backslashr
     Args:
         buf: The buffer to decode from.
     """
-    buf = bytes(buf)
+    codec = CODEPAGE_MAP[encoding]
 
-    if encoding == CODEPAGE.UNICODE and len(buf) % 2:
-        buf += b"\x00"
+    # Decode straight from the (memoryview) buffer, only odd length UTF-16 data needs to be copied to be padded
+    if codec == "utf-16-le" and len(buf) % 2:
+        buf = bytes(buf) + b"\x00"
 
-    return buf.decode(CODEPAGE_MAP[encoding], errors=errors).rstrip("\x00")
+    return _CODEC_DECODERS[codec](buf, errors)[0].rstrip("\x00")
 
 
 def decode_guid(buf: bytes) -> str:
@@ -48,16 +57,71 @@ def decode_guid(buf: bytes) -> str:
 
     Args:
         buf: The buffer to decode from.
+
+    Raises:
+        ValueError: If the buffer is not 16 bytes.
     """
-    return str(UUID(bytes_le=bytes(buf)))
+    if len(buf) != 16:
+        raise ValueError(f"GUID must be 16 bytes, got {len(buf)}")
+    return _format_guid(bytes(buf))
+
+
+_GUID = struct.Struct("<IHH8s")
+
+
+@lru_cache(4096)
+def _format_guid(buf: bytes) -> str:
+    # Databases tend to reference the same GUIDs over and over again, so remember their string form
+    # Format the fields directly, which is faster than going through UUID(bytes_le=buf)
+    data1, data2, data3, data4 = _GUID.unpack(buf)
+    data4 = data4.hex()
+    return f"{data1:08x}-{data2:04x}-{data3:04x}-{data4[:4]}-{data4[4:]}"
 
 
 def checksum_xor(data: bytes, initial: int = 0x89ABCDEF) -> int:
-    digest = initial
-    for val in struct.unpack(f"<{len(data) // 4}I", data):
-        digest ^= val
+    """Calculate the XOR checksum of all little endian 32-bit words in the given data.
+
+    Instead of XOR'ing every word in a Python loop, the data is read as one big integer that is repeatedly folded
+    in half, so the work is done in a handful of big integer operations.
+
+    Args:
+        data: The data to calculate the checksum of, must be a multiple of 4 bytes.
+        initial: The initial checksum value.
+    """
+    if len(data) % 4:
+        raise ValueError(f"Data length must be a multiple of 4: {len(data)}")
+
+    num_words = len(data) // 4
+    value = int.from_bytes(data, "little")
+    while num_words > 1:
+        half = num_words // 2
+        value = (value & ((1 << (half * 32)) - 1)) ^ (value >> (half * 32))
+        num_words -= half
+
+    return initial ^ value
+
+
+def _unpack(fmt: str) -> Callable[[bytes], int | float]:
+    """Create a parse function for a single fixed size value.
+
+    A precompiled ``struct`` is a lot faster than parsing the value with the equivalent cstruct type.
+
+    The returned function raises an ``EOFError`` if the buffer is too small, like the cstruct type would.
+
+    Args:
+        fmt: The ``struct`` format of the value.
+    """
+    packer = struct.Struct(fmt)
+    unpack_from = packer.unpack_from
+    size = packer.size
+
+    def parse(buf: bytes) -> int | float:
+        try:
+            return unpack_from(buf)[0]
+        except struct.error:
+            raise EOFError(f"Read {len(buf)} bytes, but expected {size}") from None
 
-    return digest
+    return parse
 
 
 class ColumnType(NamedTuple):
@@ -70,24 +134,24 @@ class ColumnType(NamedTuple):
 COLUMN_TYPES = [
     ColumnType(JET_coltyp.Nil, "NULL", 0, None),
     ColumnType(JET_coltyp.Bit, "Boolean", 1, decode_bit),
-    ColumnType(JET_coltyp.UnsignedByte, "Unsigned byte", 1, c_ese.uint8),
-    ColumnType(JET_coltyp.Short, "Signed short", 2, c_ese.int16),
-    ColumnType(JET_coltyp.Long, "Signed long", 4, c_ese.int32),
-    ColumnType(JET_coltyp.Currency, "Currency", 8, c_ese.int64),
-    ColumnType(JET_coltyp.IEEESingle, "Single precision FP", 4, c_ese.float),
-    ColumnType(JET_coltyp.IEEEDouble, "Double precision FP", 8, c_ese.double),
+    ColumnType(JET_coltyp.UnsignedByte, "Unsigned byte", 1, _unpack("<B")),
+    ColumnType(JET_coltyp.Short, "Signed short", 2, _unpack("<h")),
+    ColumnType(JET_coltyp.Long, "Signed long", 4, _unpack("<i")),
+    ColumnType(JET_coltyp.Currency, "Currency", 8, _unpack("<q")),
+    ColumnType(JET_coltyp.IEEESingle, "Single precision FP", 4, _unpack("<f")),
+    ColumnType(JET_coltyp.IEEEDouble, "Double precision FP", 8, _unpack("<d")),
     # Parse DateTime as an int64 because the actual parsing of the value can differ between databases
     # E.g. by default it's supposed to be an OA date, but the UAL stores it as a regular Windows timestamp
-    ColumnType(JET_coltyp.DateTime, "DateTime", 8, c_ese.int64),
+    ColumnType(JET_coltyp.DateTime, "DateTime", 8, _unpack("<q")),
     ColumnType(JET_coltyp.Binary, "Binary", None, bytes),
     ColumnType(JET_coltyp.Text, "Text", None, decode_text),
     ColumnType(JET_coltyp.LongBinary, "Long Binary", None, bytes),
     ColumnType(JET_coltyp.LongText, "Long Text", None, decode_text),
     ColumnType(JET_coltyp.SLV, "Super Long Value", None, None),
-    ColumnType(JET_coltyp.UnsignedLong, "Unsigned long", 4, c_ese.uint32),
-    ColumnType(JET_coltyp.LongLong, "Signed Long long", 8, c_ese.int64),
+    ColumnType(JET_coltyp.UnsignedLong, "Unsigned long", 4, _unpack("<I")),
+    ColumnType(JET_coltyp.LongLong, "Signed Long long", 8, _unpack("<q")),
     ColumnType(JET_coltyp.GUID, "GUID", 16, decode_guid),
-    ColumnType(JET_coltyp.UnsignedShort, "Unsigned short", 2, c_ese.uint16),
+    ColumnType(JET_coltyp.UnsignedShort, "Unsigned short", 2, _unpack("<H")),
     ColumnType(JET_coltyp.Max, "Max", None, None),
 ]
 COLUMN_TYPE_MAP = {t.value.value: t for t in COLUMN_TYPES}
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import array
 import itertools
 import re
-from functools import lru_cache
+import struct
+import sys
+from functools import cached_property, lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
@@ -48,6 +51,9 @@ SERIAL_TYPES = {
     9: lambda fh: 1,
 }
 
+# Byte sizes of the fixed size serial types, indexed by serial type
+SERIAL_TYPE_SIZES = (0, 1, 2, 3, 4, 6, 8, 8, 0, 0)
+
 # See https://sqlite.org/fileformat2.html#magic_header_string
 SQLITE3_HEADER_MAGIC = b"SQLite format 3\x00"
 
@@ -130,12 +136,24 @@ class SQLite3:
         for checkpoint in self.wal.checkpoints:
             yield SQLite3(self.fh, self.wal, checkpoint)
 
-    def table(self, name: str) -> Table | None:
-        name = name.lower()
+    @cached_property
+    def _table_map(self) -> dict[str, Table]:
+        """Map the lowercase names of all tables to their :class:`Table`, resolved once on first lookup."""
+        table_map = {}
         for table in self.tables():
-            if table.name.lower() == name:
-                return table
-        return None
+            table_map.setdefault(table.name.lower(), table)
+        return table_map
+
+    @cached_property
+    def _index_map(self) -> dict[str, Index]:
+        """Map the lowercase names of all indices to their :class:`Index`, resolved once on first lookup."""
+        index_map = {}
+        for index in self.indices():
+            index_map.setdefault(index.name.lower(), index)
+        return index_map
+
+    def table(self, name: str) -> Table | None:
+        return self._table_map.get(name.lower())
 
     def tables(self) -> Iterator[Table]:
         # Page 1 contains sqlite_master table
@@ -146,11 +164,7 @@ class SQLite3:
             yield Table(self, *cell.values)
 
     def index(self, name: str) -> Index | None:
-        name = name.lower()
-        for index in self.indices():
-            if index.name.lower() == name:
-                return index
-        return None
+        return self._index_map.get(name.lower())
 
     def indices(self) -> Iterator[Index]:
         # Page 1 contains sqlite_master table
@@ -182,10 +196,8 @@ class SQLite3:
 
         # Check if the latest valid instance of the page is committed (either the frame itself
         # is the commit frame or it is included in a commit's frames). If so, return that frame's data.
-        if self.wal:
-            for commit in reversed(self.wal.commits):
-                if (frame := commit.get(num)) and frame.valid:
-                    return frame.data
+        if self.wal and (frame := self.wal.page_map.get(num)):
+            return frame.data
 
         # Else we read the page from the database file.
         if num == 1:  # Page 1 is root
@@ -215,7 +227,9 @@ class Column:
     TOKENIZER_EXPRESSION = re.compile(f"({SPACE}|{EXPRESSION}|{STRING})")
 
     def __init__(self, name: str, description: str):
-        self.name = name
+        # Every row of a table maps its values by these names, interning them lets lookups with
+        # (interned) string literals succeed on identity
+        self.name = sys.intern(name)
         self.default_value = self._parse_default_value_from_description(description)
 
     def _parse_default_value_from_description(self, description: str) -> bool | str | int | float | None:
@@ -293,20 +307,32 @@ class Table:
         self.table_name = table_name
         self.page = page
         self.sql = sql
-        self.columns = []
-        self.primary_key = None
-
-        self.primary_key, columns, _ = parse_table_columns_constraints(sql)
-        self.columns = [Column(name, description) for name, description in columns]
 
     def __repr__(self) -> str:
         return f"<Table name={self.name} page={self.page}>"
 
+    @cached_property
+    def primary_key(self) -> str | None:
+        """The name of the primary key column, or ``None`` if there is none or it is a compound key."""
+        return _parse_table_sql(self.sql)[0]
+
+    @cached_property
+    def columns(self) -> list[Column]:
+        """The columns of this table, only parsed from the ``CREATE TABLE`` statement when first accessed."""
+        return [Column(name, description) for name, description in _parse_table_sql(self.sql)[1]]
+
     def __iter__(self) -> Iterator[Row]:
         return self.rows()
 
     def row(self, idx: int) -> Row:
-        return list(self.rows())[idx]
+        if idx < 0:
+            # Negative indices are relative to the end, so we need all rows anyway
+            return list(self.rows())[idx]
+
+        # Otherwise only walk up to the requested row instead of parsing every row in the table
+        if (row := next(itertools.islice(self.rows(), idx, None), None)) is None:
+            raise IndexError("Row index out of range")
+        return row
 
     def rows(self) -> Iterator[Row]:
         for cell in walk_tree(self.sqlite, self.sqlite.page(self.page)):
@@ -345,16 +371,14 @@ class Row:
         If there are any cell values with unknown column names
         they get added to the unknown list.
         """
+        num_values = len(values)
 
-        row_values = {}
-        unknowns = []
-
-        for column, value in itertools.zip_longest(columns, values, fillvalue=Empty):
-            column_value = column.default_value if value is Empty else value
-            if column is Empty:
-                unknowns.append(column_value)
-            else:
-                row_values.update({column.name: column_value})
+        # Build the mapping in bulk, this runs for every row of a table
+        row_values = {column.name: value for column, value in zip(columns, values, strict=False)}
+        # Columns without a value in this cell (e.g. added later with ALTER TABLE) get their default value
+        for column in columns[num_values:]:
+            row_values[column.name] = column.default_value
+        unknowns = values[len(columns) :]
 
         return row_values, unknowns
 
@@ -404,10 +428,14 @@ class Page:
             c_sqlite3.PAGE_TYPE_INTERIOR_INDEX,
             c_sqlite3.PAGE_TYPE_INTERIOR_TABLE,
         ):
-            self.right_page = c_sqlite3.uint32(buf[fp : fp + 4])
+            self.right_page = int.from_bytes(buf[fp : fp + 4], "big")
             fp += 4
 
-        self.cell_pointers = c_sqlite3.uint16[self.header.cell_count](buf[fp : fp + (self.header.cell_count * 2)])
+        # Keep the cell pointers as a compact array of big endian uint16 values
+        self.cell_pointers = array.array("H")
+        self.cell_pointers.frombytes(buf[fp : fp + (self.header.cell_count * 2)])
+        if sys.byteorder == "little":
+            self.cell_pointers.byteswap()
 
         self.cell = lru_cache(256)(self.cell)
 
@@ -431,6 +459,21 @@ class Page:
 
 
 class Cell:
+    __slots__ = (
+        "_data",
+        "_offset",
+        "_record_offset",
+        "_types",
+        "_values",
+        "key",
+        "left_page",
+        "max_payload_size",
+        "min_payload_size",
+        "offset",
+        "page",
+        "size",
+    )
+
     def __init__(self, page: Page, offset: int):
         self.page = page
         self.offset = offset
@@ -445,27 +488,29 @@ class Cell:
         self._values = None
 
         sqlite = page.sqlite
-        cell_buf = BytesIO(page.data[self._offset :])
+        # Parse the cell header directly from the page data, instead of copying the rest of the page into a BytesIO
+        buf = page.data
+        offset = self._offset
 
         self.max_payload_size = (sqlite.usable_page_size - 12) * 64 // 255 - 23
         self.min_payload_size = (sqlite.usable_page_size - 12) * 32 // 255 - 23
 
         if page.header.flags == c_sqlite3.PAGE_TYPE_LEAF_TABLE:
-            self.size = varint(cell_buf)
-            self.key = varint(cell_buf)
+            self.size, offset = varint_at(buf, offset)
+            self.key, offset = varint_at(buf, offset)
             self.max_payload_size = sqlite.usable_page_size - 35
         elif page.header.flags == c_sqlite3.PAGE_TYPE_INTERIOR_TABLE:
-            self.left_page = c_sqlite3.uint32(cell_buf)
-            self.key = varint(cell_buf)
+            self.left_page = int.from_bytes(buf[offset : offset + 4], "big")
+            self.key, offset = varint_at(buf, offset + 4)
         elif page.header.flags == c_sqlite3.PAGE_TYPE_LEAF_INDEX:
-            self.size = varint(cell_buf)
+            self.size, offset = varint_at(buf, offset)
         elif page.header.flags == c_sqlite3.PAGE_TYPE_INTERIOR_INDEX:
-            self.left_page = c_sqlite3.uint32(cell_buf)
-            self.size = varint(cell_buf)
+            self.left_page = int.from_bytes(buf[offset : offset + 4], "big")
+            self.size, offset = varint_at(buf, offset + 4)
         else:
             raise InvalidPageType("Unknown page type")
 
-        self._record_offset = cell_buf.tell()
+        self._record_offset = offset - self._offset
 
     def __repr__(self) -> str:
         return f"<Cell page={self.page.num} offset=0x{self.offset:x}>"
@@ -502,7 +547,7 @@ class Cell:
                 local_buf = page_data[offset : offset + local_size + 4]
                 result.append(local_buf[:-4])
 
-                overflow_page = c_sqlite3.uint32(local_buf[-4:])
+                overflow_page = int.from_bytes(local_buf[-4:], "big")
                 overflow_size = self.size - local_size
 
                 while overflow_page:
@@ -514,7 +559,7 @@ class Cell:
                     data_size = min(overflow_size + 4, page_size)
                     page_buf = self.page.sqlite.raw_page(overflow_page)[:data_size]
 
-                    overflow_page = c_sqlite3.uint32(page_buf[:4])
+                    overflow_page = int.from_bytes(page_buf[:4], "big")
                     result.append(page_buf[4:])
 
                 buf = b"".join(result)
@@ -524,7 +569,7 @@ class Cell:
         return self._data
 
     def _read_record(self) -> None:
-        self._types, self._values = read_record(BytesIO(self.data), self.page.sqlite.encoding)
+        self._types, self._values = read_record_buf(self.data, self.page.sqlite.encoding)
 
     @property
     def types(self) -> list[int]:
@@ -541,22 +586,35 @@ class Cell:
         return self._values
 
 
+@lru_cache(256)
+def _parse_table_sql(sql: str) -> tuple[str | None, tuple[tuple[str, str], ...]]:
+    """Parse the primary key and column definitions of a ``CREATE TABLE`` statement.
+
+    Every call to :meth:`SQLite3.tables` creates new :class:`Table` objects from the same statements,
+    so the (immutable) result of parsing them is cached.
+    """
+    primary_key, columns, _ = parse_table_columns_constraints(sql)
+    return primary_key, tuple(columns)
+
+
 def walk_tree(sqlite: SQLite3, page: Page) -> Iterator[Cell]:
-    if page.header.flags in (
-        c_sqlite3.PAGE_TYPE_LEAF_TABLE,
-        c_sqlite3.PAGE_TYPE_LEAF_INDEX,
-    ):
-        for cell in page.cells():
-            yield cell
-    else:
-        for cell in page.cells():
-            left_page = sqlite.page(cell.left_page)
-            for cell in walk_tree(sqlite, left_page):
-                yield cell
+    # Use an explicit stack of page numbers to visit instead of recursing,
+    # so cells aren't passed through a generator for every level of the tree
+    stack = []
+    while True:
+        if page.header.flags in (
+            c_sqlite3.PAGE_TYPE_LEAF_TABLE,
+            c_sqlite3.PAGE_TYPE_LEAF_INDEX,
+        ):
+            yield from page.cells()
+        else:
+            # Visit the left page of every cell in order, followed by the right page
+            stack.append(page.right_page)
+            stack.extend(reversed([cell.left_page for cell in page.cells()]))
 
-        right_page = sqlite.page(page.right_page)
-        for cell in walk_tree(sqlite, right_page):
-            yield cell
+        if not stack:
+            break
+        page = sqlite.page(stack.pop())
 
 
 def read_record(fh: BinaryIO, encoding: str) -> tuple[list[int], list[int | float | str | bytes | None]]:
@@ -572,6 +630,8 @@ def read_record(fh: BinaryIO, encoding: str) -> tuple[list[int], list[int | floa
     for type_ in types:
         if type_ in SERIAL_TYPES:
             val = SERIAL_TYPES[type_](fh)
+        elif type_ < 12:
+            raise ValueError(f"Reserved serial type in record: {type_}")
         else:
             if type_ % 2 == 0:
                 val = fh.read((type_ - 12) // 2)
@@ -586,6 +646,53 @@ def read_record(fh: BinaryIO, encoding: str) -> tuple[list[int], list[int | floa
     return types, values
 
 
+def read_record_buf(buf: bytes, encoding: str) -> tuple[list[int], list[int | float | str | bytes | None]]:
+    """Parse a record from ``buf``, without having to wrap the buffer in a file-like object.
+
+    Equivalent to :func:`read_record`, but slices the values directly from the buffer.
+    """
+    size, offset = varint_at(buf, 0)
+
+    types = []
+    while offset < size:
+        type_, offset = varint_at(buf, offset)
+        types.append(type_)
+
+    values = []
+    for type_ in types:
+        if type_ < len(SERIAL_TYPE_SIZES):
+            size = SERIAL_TYPE_SIZES[type_]
+            end = offset + size
+            # NULL and the integer constants 0 and 1 have no value bytes, so they can't be truncated
+            if size and end > len(buf):
+                raise EOFError(f"Record value of serial type {type_} extends beyond the end of the record")
+
+            if type_ == 0:
+                val = None
+            elif type_ == 7:
+                val = struct.unpack(">d", buf[offset:end])[0]
+            elif type_ >= 8:
+                val = type_ - 8
+            else:
+                val = int.from_bytes(buf[offset:end], "big", signed=True)
+        elif type_ < 12:
+            raise ValueError(f"Reserved serial type in record: {type_}")
+        elif type_ % 2 == 0:
+            end = offset + (type_ - 12) // 2
+            val = buf[offset:end]
+        else:
+            end = offset + (type_ - 13) // 2
+            try:
+                val = buf[offset:end].decode(encoding)
+            except UnicodeDecodeError as e:
+                val = e.object
+
+        values.append(val)
+        offset = end
+
+    return types, values
+
+
 def varint(fh: BinaryIO) -> int:
     byte_num = 0
     value = 0
@@ -603,3 +710,27 @@ def varint(fh: BinaryIO) -> int:
             byte_num += 1
         else:
             return value
+
+
+def varint_at(buf: bytes, offset: int) -> tuple[int, int]:
+    """Read a varint from ``buf`` at ``offset``, without having to wrap the buffer in a file-like object.
+
+    Returns:
+        A tuple of the value and the offset directly after the varint.
+    """
+    start = offset
+    value = 0
+
+    while True:
+        val = buf[offset]
+        offset += 1
+
+        if offset - start == 9:
+            value |= val
+            return value, offset
+
+        value |= val & 0x7F
+        if val & 0x80:
+            value = value << 7
+        else:
+            return value, offset
@@ -9,47 +9,58 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
+# Characters that change the state of the SQL list splitter, everything in between is copied as is
+_SQL_LIST_TOKENS = re.compile(r"--|[(),\"'`]")
+
+
 def split_sql_list(sql: str) -> Iterator[str]:
     """Split a string on comma's (``,``) while ignoring any comma's contained
     within an arbitrary level of nested braces (``( )``).
     """
     level = 0
-    comment = 0
     quote = None
-    line_buf = ""
-
-    for char in sql:
-        if not quote and char == "-" and comment != 2:
-            comment += 1
-        elif comment == 2 and char == "\n":
-            comment = 0
-        elif comment != 2:
-            if comment == 1:
-                line_buf += "-"
-                comment = 0
-
-            if char == "(":
-                level += 1
-                line_buf += char
-            elif char == ")":
-                level -= 1
-                line_buf += char
-            elif char == "," and level == 0:
-                yield line_buf.strip()
-                line_buf = ""
-            else:
-                if char in ('"', "'", "`"):
-                    if not quote:
-                        quote = char
-                    elif char == quote:
-                        quote = None
-                line_buf += char
+    parts = []
+    start = 0
+    pos = 0
+
+    # Only visit the characters of interest and slice the text in between, instead of walking every character
+    while match := _SQL_LIST_TOKENS.search(sql, pos):
+        token = match.group()
+        pos = match.end()
+
+        if token == "--":
+            if quote:
+                continue
+
+            # Skip the comment up to and including the end of the line
+            parts.append(sql[start : match.start()])
+            pos = start = sql.find("\n", pos) + 1 or len(sql)
+        elif token == "(":
+            level += 1
+        elif token == ")":
+            level -= 1
+        elif token == ",":
+            if level == 0:
+                parts.append(sql[start : match.start()])
+                yield "".join(parts).strip()
+                parts = []
+                start = pos
+        elif not quote:
+            quote = token
+        elif token == quote:
+            quote = None
 
     if level != 0:
         bracket_type = "(" if level < 0 else ")"
         raise InvalidSQL(f"Not a valid SQL list definition: {sql!r} missing {level} {bracket_type}'s")
 
-    if line_buf:
+    tail = sql[start:]
+    if not quote and tail.endswith("-"):
+        # A trailing dash is treated as the start of a comment
+        tail = tail[:-1]
+    parts.append(tail)
+
+    if line_buf := "".join(parts):
         yield line_buf.strip()
 
 
@@ -86,6 +86,19 @@ class WAL:
 
         return commits
 
+    @cached_property
+    def page_map(self) -> dict[int, Frame]:
+        """Return the latest valid committed frame for every page number in the WAL file.
+
+        Built in a single pass over all commits, oldest first, so later commits overwrite earlier ones.
+        """
+        return {
+            page_number: frame
+            for commit in self.commits
+            for page_number, frame in commit.page_map.items()
+            if frame.valid
+        }
+
     @cached_property
     def checkpoints(self) -> list[Checkpoint]:
         """Return deduplicated checkpoints, oldest first.
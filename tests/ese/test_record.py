@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from typing import BinaryIO
+from unittest.mock import MagicMock
 
+from dissect.database.ese.c_ese import TAGFLD_HEADER
 from dissect.database.ese.ese import ESE
-from dissect.database.ese.record import Record
+from dissect.database.ese.record import Record, RecordData
 
 
 def test_as_dict(basic_db: BinaryIO) -> None:
@@ -79,3 +81,35 @@ def test_parse_value_encoding(windows_search_db: BinaryIO) -> None:
     auto_summary = record.get("4625-System_Search_AutoSummary")
     assert auto_summary.startswith("Hong Kong SCS AdobeMingStd-Light-Acro-HKscs-B5-H ASCII")
     assert auto_summary.endswith("\\x4c\\xd8")
+
+
+def test_get_multivalue_not_shared(multi_db: BinaryIO) -> None:
+    db = ESE(multi_db)
+    table = db.table("multi")
+
+    record = next(table.records())
+
+    value = record.get("UnsignedByte")
+    assert value == [0, 127, 255]
+
+    # Modifying a returned multi-value must not affect later reads of the same record
+    value.append(1)
+    assert record.get("UnsignedByte") == [0, 127, 255]
+
+    record.as_dict()["UnsignedByte"].clear()
+    assert record.UnsignedByte == [0, 127, 255]
+    assert record.as_dict()["UnsignedByte"] == [0, 127, 255]
+
+
+def test_get_null_tagged() -> None:
+    table = MagicMock()
+    table.db.has_small_pages = False
+
+    # A record header without fixed or variable columns, followed by a single TAGFLD for column 256 whose tagged
+    # field header has the null flag set
+    data = bytes([0, 127, 4, 0]) + ((4 << 16) | 256).to_bytes(4, "little") + bytes([TAGFLD_HEADER.Null.value])
+    record = RecordData(table, MagicMock(data=data))
+
+    column = MagicMock(identifier=256, is_fixed=False, is_variable=False, is_tagged=True)
+    assert record.get(column) is None
+    assert record.get(column, raw=True) is None
@@ -30,3 +30,24 @@ def test_find_index() -> None:
     assert table.find_index(["UnsignedByte"]) is None
     assert table.find_index(["Id", "Bit"]) == mock_idx_id
     assert table.find_index(["Bit", "SomethingElse"]) == mock_idx_bit
+
+    # Adding an index invalidates previous results
+    mock_idx_unsigned_byte = MagicMock(name="IxUnsignedByte")
+    mock_idx_unsigned_byte.is_primary = False
+    mock_idx_unsigned_byte.columns = [mock_column_unsigned_byte]
+    table._add_index(mock_idx_unsigned_byte)
+
+    assert table.find_index(["UnsignedByte"]) == mock_idx_unsigned_byte
+
+
+def test_primary_index() -> None:
+    mock_idx_bit = MagicMock(name="IxBit")
+    mock_idx_bit.is_primary = False
+    mock_idx_id = MagicMock(name="IxId")
+    mock_idx_id.is_primary = True
+
+    table = Table(MagicMock(), 69, "index", indexes=[mock_idx_bit, mock_idx_id])
+    assert table.primary_index == mock_idx_id
+
+    table = Table(MagicMock(), 69, "index", indexes=[mock_idx_bit])
+    assert table.primary_index is None
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from dissect.database.ese.c_ese import JET_coltyp
+from dissect.database.ese.util import COLUMN_TYPES, ColumnType, checksum_xor, decode_guid
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b"\x01\x02\x03\x04", id="single-word"),
+        pytest.param(bytes(range(12)), id="odd-word-count"),
+        pytest.param(bytes(range(256)) * 32, id="page"),
+    ],
+)
+def test_checksum_xor(data: bytes) -> None:
+    expected = 0x89ABCDEF
+    for value in struct.unpack(f"<{len(data) // 4}I", data):
+        expected ^= value
+
+    assert checksum_xor(data) == expected
+    assert checksum_xor(memoryview(data), 0) == expected ^ 0x89ABCDEF
+
+
+def test_checksum_xor_invalid_length() -> None:
+    with pytest.raises(ValueError, match="multiple of 4"):
+        checksum_xor(b"\x00" * 5)
+
+
+@pytest.mark.parametrize(
+    "column_type",
+    [
+        pytest.param(column_type, id=column_type.value.name)
+        for column_type in COLUMN_TYPES
+        if column_type.size and column_type.value != JET_coltyp.GUID
+    ],
+)
+def test_column_type_parse_short_buffer(column_type: ColumnType) -> None:
+    assert column_type.parse(b"\x00" * column_type.size) in (0, False)
+
+    with pytest.raises(EOFError):
+        column_type.parse(b"\x00" * (column_type.size - 1))
+
+
+def test_decode_guid() -> None:
+    buf = bytes.fromhex("f10a363f6667dc469af20dacf295c2a1")
+    assert decode_guid(buf) == "3f360af1-6766-46dc-9af2-0dacf295c2a1"
+    assert decode_guid(memoryview(buf)) == "3f360af1-6766-46dc-9af2-0dacf295c2a1"
+
+    with pytest.raises(ValueError, match="16 bytes"):
+        decode_guid(buf[:15])
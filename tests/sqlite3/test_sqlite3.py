@@ -73,10 +73,33 @@ def test_sqlite(sqlite_db: Path, db_as_path: bool) -> None:
     [
         (b"\x04\x00\x1b\x02testing\x059", "utf-8", ([0, 27, 2], [None, "testing", 1337])),
         (b"\x02\x65\x80\x81\x82\x83", "utf-8", ([101], [b"\x80\x81\x82\x83"])),
+        (
+            bytes.fromhex("070000050941080c02ff08090f"),
+            "utf-8",
+            ([0, 0, 5, 9, 65, 8], [None, None, 13207008184591, 1, "", 0]),
+        ),
     ],
 )
 def test_sqlite_read_record(input: bytes, encoding: str, expected_output: tuple[list[int], list[Any]]) -> None:
     assert sqlite3.read_record(BytesIO(input), encoding) == expected_output
+    assert sqlite3.read_record_buf(input, encoding) == expected_output
+
+
+@pytest.mark.parametrize(
+    ("input", "exception"),
+    [
+        pytest.param(b"\x02\x04\x00\x01", EOFError, id="truncated-int"),
+        pytest.param(b"\x02\x07\x00", EOFError, id="truncated-float"),
+        pytest.param(b"\x02\x0a", ValueError, id="reserved-10"),
+        pytest.param(b"\x03\x0b\x01\x05", ValueError, id="reserved-11"),
+    ],
+)
+def test_sqlite_read_record_invalid(input: bytes, exception: type[Exception]) -> None:
+    with pytest.raises(exception):
+        sqlite3.read_record(BytesIO(input), "utf-8")
+
+    with pytest.raises(exception):
+        sqlite3.read_record_buf(input, "utf-8")
 
 
 def test_empty(empty_db: BinaryIO) -> None: